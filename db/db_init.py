@@ -34,7 +34,7 @@ class InitDatabase:
         {Fore.YELLOW}Schema: {schema}{Style.RESET_ALL}
         """)
 
-        self.vault_manager = VaultManager()  # Fetch secrets securely from Vault
+        self.vault_manager = VaultManager.instance()  # Fetch secrets securely from Vault
         self.database = database
         self.schema = schema
 
@@ -8,11 +8,58 @@
 
 
 import os
+import csv
+from functools import lru_cache
+from io import StringIO
 from sqlalchemy import create_engine
+from psycopg2.errors import InsufficientPrivilege
 import hvac
 import traceback
 import inspect
 
+# COPY's NULL marker; CSV's default (an unquoted empty field) would also turn empty strings into NULL
+_COPY_NULL = r'\N'
+
+
+def psql_insert_copy(table, conn, keys, data_iter):
+    """
+    pandas `to_sql` insertion method that streams rows through PostgreSQL `COPY ... FROM STDIN`.
+
+    Args:
+        table (pandas.io.sql.SQLTable): Target table wrapper supplied by pandas.
+        conn (sqlalchemy.engine.Connection): Active SQLAlchemy connection.
+        keys (list[str]): Column names in insert order.
+        data_iter (Iterable): Iterable of row tuples for the current chunk.
+    """
+    dbapi_conn = conn.connection
+    with dbapi_conn.cursor() as cur:
+        # Serialize the chunk as CSV into an in-memory buffer
+        s_buf = StringIO()
+        writer = csv.writer(s_buf)
+        # Write None as the explicit NULL marker so empty strings survive the load
+        writer.writerows(tuple(_COPY_NULL if v is None else v for v in row) for row in data_iter)
+        s_buf.seek(0)
+
+        columns = ', '.join(f'"{k}"' for k in keys)
+        table_name = f'"{table.schema}"."{table.name}"' if table.schema else f'"{table.name}"'
+
+        cur.copy_expert(sql=f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{_COPY_NULL}')", file=s_buf)
+
+
+@lru_cache(maxsize=8)
+def _get_engine(db_uri: str):
+    """Returns a pooled SQLAlchemy engine for the given DB URI, built once per process."""
+    return create_engine(
+        db_uri,
+        pool_pre_ping=True,
+        pool_size=4,
+        max_overflow=8,
+        executemany_mode="values_plus_batch",
+        insertmanyvalues_page_size=1000,
+        echo=False,
+        future=True
+    )
+
 
 class PostgresLoad:
 
@@ -29,6 +76,16 @@ class PostgresLoad:
             )
         )
 
+        # GET THE POSTGRES SECRETS AND BUILD THE DB URI
+        user = self.__secrets["POSTGRES_USER"]
+        password = self.__secrets["POSTGRES_PASSWORD"]
+        uri = self.__secrets["POSTGRES_URI"]
+        port = self.__secrets["POSTGRES_PORT"]
+        database = self.__data["destination"]["database"]
+
+        # DEFINE THE DB URI
+        self.__db_uri = f'postgresql://{user}:{password}@{uri}:{port}/{database}'
+
     def load_to_postgres(self):
         print(f'\n============  [START] - {inspect.currentframe().f_code.co_name}  ============\n')
 
@@ -37,19 +94,34 @@ class PostgresLoad:
         table = f'{self.__data["source_method"]}_{self.__data["destination"]["table"]}'
 
         try:
-            # GET THE POSTGRES SECRETS AND BUILD THE DB URI
-            user = self.__secrets["POSTGRES_USER"]
-            password = self.__secrets["POSTGRES_PASSWORD"]
-            uri = self.__secrets["POSTGRES_URI"]
-            port = self.__secrets["POSTGRES_PORT"]
-
-            # DEFINE THE DB URI
-            db_uri = f'postgresql://{user}:{password}@{uri}:{port}/{database}'
-
-            # DEFINE THE ENGINE (CONNECTION OBJECT)
-            engine = create_engine(db_uri, echo=True)
+            # GET THE CACHED ENGINE (CONNECTION OBJECT)
+            engine = _get_engine(self.__db_uri)
 
-            self.__df_input.to_sql(table, con=engine, if_exists='replace', index=False, schema=schema)
+            # CREATE/REPLACE THE TABLE AND STREAM THE ROWS IN WITH COPY
+            try:
+                self.__df_input.to_sql(
+                    table,
+                    con=engine,
+                    if_exists='replace',
+                    index=False,
+                    schema=schema,
+                    method=psql_insert_copy,
+                    chunksize=50_000
+                )
+            except (InsufficientPrivilege, AttributeError):
+                # COPY UNAVAILABLE (RESTRICTED ROLE, DRIVER WITHOUT copy_expert): FALL BACK TO MULTI-ROW INSERTS
+                # ANY OTHER FAILURE (BAD DATA, CONSTRAINTS, CONNECTION) WOULD FAIL AGAIN, SO IT GOES TO THE 500 BELOW
+                # to_sql RUNS IN ONE TRANSACTION, SO THE FAILED ATTEMPT HAS ALREADY BEEN ROLLED BACK
+                print(f'COPY failed, falling back to multi-row INSERTs:\n{traceback.format_exc()}')
+                self.__df_input.to_sql(
+                    table,
+                    con=engine,
+                    if_exists='replace',
+                    index=False,
+                    schema=schema,
+                    method='multi',
+                    chunksize=1000
+                )
 
             return {
                 "result": {
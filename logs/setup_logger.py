@@ -10,11 +10,15 @@ class Logger:
         print("inside logger")
         # print(task)
         self.logger = logging.getLogger(config["JOB_TITLE"])
+
+        # getLogger returns the same logger per name, so don't stack another set of handlers
+        if self.logger.handlers:
+            return
+
+        self.logger.propagate = False  # Avoid double-logging through the root logger
+
         logs_dir = config["LOGS_DIR"] + "/" + config["JOB_TITLE"]
-        try:
-            os.mkdir(logs_dir)
-        except Exception as e:
-            pass
+        os.makedirs(logs_dir, exist_ok=True)
 
         formatter = logging.Formatter(
             "%(asctime)s,%(levelname)s,[%(lineno)d],%(funcName)s(),%(message)s",
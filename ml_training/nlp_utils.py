@@ -1,9 +1,17 @@
+import numpy as np
 import pandas as pd
 import spacy
-from typing import List, Optional
-from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
+from typing import FrozenSet, Iterable, Iterator, List, Optional, Tuple
+from scipy.sparse import spmatrix
+from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer, HashingVectorizer
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer, SentiText
 
+# Shared VADER analyzer so the lexicon is only parsed once per process
+_SID = SentimentIntensityAnalyzer()
+_VADER_LEXICON = _SID.lexicon  # token -> valence, used by the bulk lexicon scorer
+_VADER_ALPHA = 15  # VADER's normalization constant for the compound score
+_VADER_STRIP_PUNC = SentiText._strip_punc_if_word  # VADER's word cleanup ("good." -> "good", keeps ":)")
+
 
 class NLPPrep:
     """
@@ -35,8 +43,8 @@ class NLPPrep:
         self.remove_stopwords = remove_stopwords
         self.keep_pos = keep_pos
 
-        self.__nlp = spacy.load(model)  # Load the spaCy model
-        self.__stopwords = self.__nlp.Defaults.stop_words  # Get default stopwords from spaCy
+        # Load the spaCy model; the parser and NER are not needed for preprocessing
+        self.__nlp = spacy.load(model, disable=['parser', 'ner'])
 
     def preprocess(
             self,
@@ -58,24 +66,65 @@ class NLPPrep:
         Returns:
             List of processed tokens (strings).
         """
-        doc = self.__nlp(text)
+        lc, rs, kp_set = self._resolve_overrides(lowercase, remove_stopwords, keep_pos)
+        return self._filter(self.__nlp(text), lc, rs, kp_set)
+
+    def preprocess_many(
+            self,
+            texts: Iterable[str],
+            batch_size: int = 256,
+            n_process: int = 1,
+            lowercase: Optional[bool] = None,
+            remove_stopwords: Optional[bool] = None,
+            keep_pos: Optional[List[str]] = None
+    ) -> Iterator[List[str]]:
+        """
+        Batch version of `preprocess` that streams texts through `nlp.pipe`.
+
+        Args:
+            texts: Iterable of input strings to preprocess.
+            batch_size: Number of texts buffered per spaCy batch (default is 256).
+            n_process: Number of worker processes; -1 uses all CPU cores (default is 1).
+                On Windows, workers are spawned and re-import the caller's module, so
+                n_process > 1 requires the call to sit under an `if __name__ == '__main__':` guard.
+            lowercase: Override the default lowercase behavior (optional).
+            remove_stopwords: Override the default stopword removal (optional).
+            keep_pos: Override the default POS filtering (optional).
+
+        Yields:
+            List of processed tokens (strings) for each input text, in input order.
+        """
+        lc, rs, kp_set = self._resolve_overrides(lowercase, remove_stopwords, keep_pos)
 
-        # Apply overrides if provided
+        for doc in self.__nlp.pipe(texts, batch_size=batch_size, n_process=n_process):
+            yield self._filter(doc, lc, rs, kp_set)
+
+    def _resolve_overrides(
+            self,
+            lowercase: Optional[bool],
+            remove_stopwords: Optional[bool],
+            keep_pos: Optional[List[str]]
+    ) -> Tuple[bool, bool, Optional[FrozenSet[str]]]:
+        """Internal method: Apply per-call overrides on top of the instance defaults."""
         lc = lowercase if lowercase is not None else self.lowercase
         rs = remove_stopwords if remove_stopwords is not None else self.remove_stopwords
         kp = keep_pos if keep_pos is not None else self.keep_pos
+        kp_set = frozenset(kp) if kp else None  # Built per call so later changes to keep_pos apply
+        return lc, rs, kp_set
 
+    def _filter(self, doc, lc: bool, rs: bool, kp_set: Optional[FrozenSet[str]]) -> List[str]:
+        """Internal method: Apply the token filters to a spaCy Doc and return the kept tokens."""
         tokens = []
 
         for token in doc:
             if token.is_punct or token.is_space:
                 continue  # Skip punctuation and spaces
-            if rs and token.text.lower() in self.__stopwords:
-                continue  # Skip stopwords if removal is enabled
-            if kp and token.pos_ not in kp:
+            if rs and token.is_stop:
+                continue  # Skip stopwords if removal is enabled (precomputed spaCy flag)
+            if kp_set and token.pos_ not in kp_set:
                 continue  # Skip tokens not matching the desired POS tags
 
-            word = token.lemma_ if token.lemma_ != "-PRON-" else token.text
+            word = token.lemma_
             if lc:
                 word = word.lower()  # Lowercase the token if required
 
@@ -97,19 +146,34 @@ class NLPPrep:
 
     def _get_entities(self, text: str) -> List[tuple]:
         """Internal method: Return (entity, label) tuples for named entities."""
-        return [(ent.text, ent.label_) for ent in self.__nlp(text)]
+        # NER is disabled by default, so enable it for this call only
+        self.__nlp.enable_pipe('ner')
+        try:
+            doc = self.__nlp(text)
+        finally:
+            self.__nlp.disable_pipe('ner')
+        return [(ent.text, ent.label_) for ent in doc.ents]
 
     def _get_doc(self, text: str):
-        """Internal method: Return raw spaCy Doc object."""
-        return self.__nlp(text)
+        """Internal method: Return raw spaCy Doc object with the full pipeline (sentences, noun chunks, entities)."""
+        # The parser and NER are disabled by default, so enable them for this call only
+        self.__nlp.enable_pipe('parser')
+        self.__nlp.enable_pipe('ner')
+        try:
+            return self.__nlp(text)
+        finally:
+            self.__nlp.disable_pipe('parser')
+            self.__nlp.disable_pipe('ner')
 
     def create_count_vectorizer_dataframe(
             self,
             text: pd.Series | List[List[str]],
             stop_words: str = 'english',
             ngram_range: tuple = (1, 2),
-            min_df: float = 0.2
-    ) -> pd.DataFrame:
+            min_df: float = 0.2,
+            return_sparse: bool = True,
+            return_matrix: bool = False
+    ) -> pd.DataFrame | spmatrix:
         """
         Create a DataFrame from a CountVectorizer feature matrix.
 
@@ -118,14 +182,17 @@ class NLPPrep:
             stop_words: Stopwords to filter out during vectorization.
             ngram_range: Tuple for the n-gram range (e.g., (1, 2) for unigrams and bigrams).
             min_df: Minimum document frequency for a term to be included.
+            return_sparse: Back the DataFrame with sparse columns instead of a dense array (default is True).
+            return_matrix: Return the raw scipy sparse matrix for sklearn consumers (default is False).
 
         Returns:
-            A pandas DataFrame with vectorized features.
+            A pandas DataFrame with vectorized features, or the sparse matrix if `return_matrix` is set.
         """
         # Confirm and convert token lists into strings
         if isinstance(text, pd.Series) or (isinstance(text, list) and isinstance(text[0], list)):
             print(f"[Vectorizer] Joining {len(text)} token lists into space-separated strings.")
-        text = [' '.join(tokens) for tokens in text]
+        # Lazily join so sklearn consumes one string at a time (fit_transform iterates once)
+        text_iter = (' '.join(tokens) if isinstance(tokens, list) else tokens for tokens in text)
 
         count_vectorizer = CountVectorizer(
             stop_words=stop_words,
@@ -133,10 +200,12 @@ class NLPPrep:
             min_df=min_df  # Only keep terms in at least 20% of docs
         )
 
-        X = count_vectorizer.fit_transform(text)
+        X = count_vectorizer.fit_transform(text_iter)
 
         print(f"[Vectorizer] Feature matrix shape: {X.shape}")
-        return pd.DataFrame(X.toarray(), columns=count_vectorizer.get_feature_names_out())
+        if return_matrix:
+            return X
+        return self._to_dataframe(X, count_vectorizer.get_feature_names_out(), return_sparse)
 
     def create_tfidf_vectorizer_dataframe(
             self,
@@ -144,8 +213,10 @@ class NLPPrep:
             stop_words: str = 'english',
             ngram_range: tuple = (1, 2),
             min_df: float = 0.2,
-            max_df: float = 0.8
-    ) -> pd.DataFrame:
+            max_df: float = 0.8,
+            return_sparse: bool = True,
+            return_matrix: bool = False
+    ) -> pd.DataFrame | spmatrix:
         """
         Create a DataFrame from a TfidfVectorizer feature matrix.
 
@@ -155,15 +226,18 @@ class NLPPrep:
             ngram_range: Tuple for the n-gram range (e.g., (1, 2) for unigrams and bigrams).
             min_df: Minimum document frequency for a term to be included.
             max_df: Maximum document frequency for a term to be included.
+            return_sparse: Back the DataFrame with sparse columns instead of a dense array (default is True).
+            return_matrix: Return the raw scipy sparse matrix for sklearn consumers (default is False).
 
         Returns:
-            A pandas DataFrame with vectorized features.
+            A pandas DataFrame with vectorized features, or the sparse matrix if `return_matrix` is set.
 
         """
         # Confirm and convert token lists into strings
         if isinstance(text, pd.Series) or (isinstance(text, list) and isinstance(text[0], list)):
             print(f"[Vectorizer] Joining {len(text)} token lists into space-separated strings.")
-        text = [' '.join(tokens) for tokens in text]
+        # Lazily join so sklearn consumes one string at a time (fit_transform iterates once)
+        text_iter = (' '.join(tokens) if isinstance(tokens, list) else tokens for tokens in text)
 
         tfidf_vectorizer = TfidfVectorizer(
             stop_words=stop_words,
@@ -172,15 +246,91 @@ class NLPPrep:
             max_df=max_df,
         )
 
-        X = tfidf_vectorizer.fit_transform(text)
+        X = tfidf_vectorizer.fit_transform(text_iter)
+
+        print(f"[Vectorizer] Feature matrix shape: {X.shape}")
+        if return_matrix:
+            return X
+        return self._to_dataframe(X, tfidf_vectorizer.get_feature_names_out(), return_sparse)
+
+    def create_hashing_vectorizer_matrix(
+            self,
+            text: pd.Series | List[List[str]],
+            stop_words: str = 'english',
+            ngram_range: tuple = (1, 2),
+            n_features: int = 2 ** 20
+    ) -> spmatrix:
+        """
+        Create a sparse feature matrix with a HashingVectorizer, for vocabularies too large to hold in memory.
+
+        Args:
+            text: A pandas Series or a list of token lists to vectorize.
+            stop_words: Stopwords to filter out during vectorization.
+            ngram_range: Tuple for the n-gram range (e.g., (1, 2) for unigrams and bigrams).
+            n_features: Number of hashed feature columns (default is 2 ** 20).
+
+        Returns:
+            A scipy sparse matrix of hashed features (no feature names are kept).
+        """
+        # Confirm and convert token lists into strings
+        if isinstance(text, pd.Series) or (isinstance(text, list) and isinstance(text[0], list)):
+            print(f"[Vectorizer] Joining {len(text)} token lists into space-separated strings.")
+        # Lazily join so sklearn consumes one string at a time (fit_transform iterates once)
+        text_iter = (' '.join(tokens) if isinstance(tokens, list) else tokens for tokens in text)
+
+        hashing_vectorizer = HashingVectorizer(
+            stop_words=stop_words,
+            ngram_range=ngram_range,
+            n_features=n_features,
+        )
+
+        X = hashing_vectorizer.fit_transform(text_iter)
 
         print(f"[Vectorizer] Feature matrix shape: {X.shape}")
-        return pd.DataFrame(X.toarray(), columns=tfidf_vectorizer.get_feature_names_out())
+        return X
+
+    @staticmethod
+    def _to_dataframe(X: spmatrix, columns, return_sparse: bool = True) -> pd.DataFrame:
+        """Internal method: Wrap a vectorizer matrix in a DataFrame, sparse-backed unless disabled."""
+        if return_sparse:
+            return pd.DataFrame.sparse.from_spmatrix(X, columns=columns)
+        return pd.DataFrame(X.toarray(), columns=columns)
 
     @staticmethod
     def sentiment_score(text: str, compound_only:bool=False) -> float:
         """Internal method: Return sentence score."""
-        sid = SentimentIntensityAnalyzer()
-        if compound_only:
-            return sid.polarity_scores(text)['compound']
-        return sid.polarity_scores(text)
+        scores = _SID.polarity_scores(text)
+        return scores['compound'] if compound_only else scores
+
+    @staticmethod
+    def sentiment_scores(texts: Iterable[str], compound_only: bool = False) -> List:
+        """Internal method: Return sentence scores for a batch of texts."""
+        return [NLPPrep.sentiment_score(text, compound_only=compound_only) for text in texts]
+
+    @staticmethod
+    def sentiment_lexicon_scores(texts: List[str], normalize: bool = True) -> np.ndarray:
+        """
+        Fast approximate sentiment for bulk workloads: sums VADER lexicon valences per text.
+
+        Unlike `sentiment_score`, this skips VADER's negation, booster, and punctuation rules,
+        trading accuracy for throughput on large batches of short texts. Words are split and
+        stripped of surrounding punctuation the same way VADER does before the lexicon lookup.
+
+        Args:
+            texts: List of input strings to score.
+            normalize: Map raw sums into [-1, 1] with VADER's compound normalization (default is True).
+
+        Returns:
+            A float32 numpy array with one score per input text.
+        """
+        lexicon_get = _VADER_LEXICON.get
+        strip_punc = _VADER_STRIP_PUNC
+        scores = np.fromiter(
+            (sum(lexicon_get(strip_punc(word), 0.0) for word in text.lower().split()) for text in texts),
+            dtype=np.float32,
+            count=len(texts)
+        )
+
+        if normalize:
+            scores = scores / np.sqrt(scores * scores + _VADER_ALPHA)
+        return scores
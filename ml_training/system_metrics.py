@@ -1,5 +1,9 @@
 import psutil
 import mlflow
+from mlflow.entities import Metric
+from mlflow.tracking import MlflowClient
+import queue
+import threading
 import time
 
 try:
@@ -11,20 +15,137 @@ except (ImportError, pynvml.NVMLError):
     print("[WARN] pynvml not available or GPU inaccessible — GPU metrics will be skipped.")
     gpu_available = False
 
-def log_system_metrics(stop_event, interval=10):
+# Minimum seconds between psutil reads; faster callers reuse the last reading
+MIN_SAMPLE_INTERVAL = 1.0
+_last = {"t": 0.0, "cpu": 0.0, "ram": 0.0}
+
+# Prime cpu_percent so later non-blocking calls measure since this point
+psutil.cpu_percent(interval=None)
+
+
+def _sample_cpu_ram():
+    now = time.monotonic()
+    if now - _last["t"] < MIN_SAMPLE_INTERVAL:
+        return _last["cpu"], _last["ram"]
+
+    cpu = psutil.cpu_percent(interval=None)
+    ram = psutil.virtual_memory().used / 1e9  # GB
+    _last.update(t=now, cpu=cpu, ram=ram)
+    return cpu, ram
+
+
+# Samples are queued by the sampler and sent to MLflow by a single background thread
+MAX_BATCH_SIZE = 100  # metrics per log_batch request
+MAX_BATCH_WAIT = 1.0  # seconds to wait for a batch to fill
+_q = queue.Queue()
+
+
+def _drainer():
+    clients = {}  # tracking URI -> MlflowClient, built on first use
+    while True:
+        batch = [_q.get()]
+        try:
+            _send_batch(batch, clients)
+        except Exception as e:
+            # Never let the drainer die, otherwise queued samples would never be flushed
+            print(f"[WARN] System metrics drainer error: {e}")
+        finally:
+            for _ in batch:
+                _q.task_done()
+
+
+def _send_batch(batch, clients):
+    """Tops `batch` up for up to MAX_BATCH_WAIT seconds (in place) and sends it with log_batch."""
+    deadline = time.monotonic() + MAX_BATCH_WAIT
+    while len(batch) < MAX_BATCH_SIZE:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(_q.get(timeout=remaining))
+        except queue.Empty:
+            break
+
+    # Group by tracking store and run so samples from concurrent runs land in the right place
+    by_run = {}
+    for tracking_uri, run_id, metric in batch:
+        by_run.setdefault((tracking_uri, run_id), []).append(metric)
+
+    for (tracking_uri, run_id), metrics in by_run.items():
+        try:
+            if tracking_uri not in clients:
+                clients[tracking_uri] = MlflowClient(tracking_uri=tracking_uri)
+            clients[tracking_uri].log_batch(run_id, metrics=metrics)
+        except Exception as e:
+            print(f"[WARN] Failed to log {len(metrics)} system metrics to MLflow: {e}")
+
+
+_drainer_lock = threading.Lock()
+_drainer_thread = None
+
+
+def _ensure_drainer():
+    """Starts the drainer thread, or restarts it if it has died."""
+    global _drainer_thread
+    with _drainer_lock:
+        if _drainer_thread is None or not _drainer_thread.is_alive():
+            _drainer_thread = threading.Thread(target=_drainer, name="system-metrics-drainer", daemon=True)
+            _drainer_thread.start()
+
+
+def _flush(timeout):
+    """Waits up to `timeout` seconds for the drainer to send everything queued so far."""
+    deadline = time.monotonic() + timeout
+    while _q.unfinished_tasks:
+        if not _drainer_thread.is_alive():
+            print("[WARN] System metrics drainer is not running; queued samples were not flushed.")
+            return
+        if time.monotonic() >= deadline:
+            print(f"[WARN] Timed out after {timeout}s flushing {_q.unfinished_tasks} system metrics.")
+            return
+        time.sleep(0.1)
+
+
+_ensure_drainer()
+
+
+def log_system_metrics(stop_event, interval=10, run_id=None, flush_timeout=30.0):
+    """
+    Samples CPU/RAM (and GPU when available) every `interval` seconds and queues them for MLflow.
+
+    Args:
+        stop_event (threading.Event): Set to stop sampling.
+        interval (float): Seconds between samples.
+        run_id (str): MLflow run to log to. Defaults to the active run, which only exists in the
+            thread that started it, so pass this when sampling from a separate thread.
+        flush_timeout (float): Maximum seconds to wait for queued samples to be sent on stop.
+    """
+    if run_id is None:
+        active_run = mlflow.active_run()
+        if active_run is None:
+            raise ValueError("No active MLflow run in this thread; pass run_id explicitly.")
+        run_id = active_run.info.run_id
+    tracking_uri = mlflow.get_tracking_uri()  # Resolved now, not when the drainer started at import
+
     while not stop_event.is_set():
-        cpu = psutil.cpu_percent()
-        ram = psutil.virtual_memory().used / 1e9  # GB
-        mlflow.log_metric("cpu_percent", cpu)
-        mlflow.log_metric("ram_used_gb", ram)
+        cpu, ram = _sample_cpu_ram()
+        metrics = {"cpu_percent": cpu, "ram_used_gb": ram}
 
         if gpu_available:
             try:
                 gpu_util = pynvml.nvmlDeviceGetUtilizationRates(gpu_handle).gpu
                 gpu_mem = pynvml.nvmlDeviceGetMemoryInfo(gpu_handle).used / 1e6  # MB
-                mlflow.log_metric("gpu_util_percent", gpu_util)
-                mlflow.log_metric("gpu_mem_used_mb", gpu_mem)
+                metrics.update({"gpu_util_percent": gpu_util, "gpu_mem_used_mb": gpu_mem})
             except pynvml.NVMLError:
                 print("[WARN] Failed to read GPU metrics this interval.")
 
+        # Hand off to the drainer thread so MLflow latency doesn't drift the sample cadence
+        now = time.time()
+        for key, value in metrics.items():
+            _q.put_nowait((tracking_uri, run_id, Metric(key, value, int(now * 1000), int(now))))
+
+        _ensure_drainer()
         stop_event.wait(interval)
+
+    # Make sure everything sampled so far reaches MLflow before returning (bounded)
+    _flush(flush_timeout)
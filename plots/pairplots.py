@@ -1,10 +1,13 @@
-import plotly.express as px
+import plotly.graph_objects as go
 import os
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime
 
+# Subsets larger than this are drawn as 2D histograms instead of scatter points
+LARGE_SUBSET_ROWS = 5000
+
 class RenderPairplot:
 
     def __init__(self,
@@ -17,19 +20,25 @@ class RenderPairplot:
         self.__quantile = quantile
         self.__dimensions = dimensions
 
-    def plotly(self, quantile: float = None, dimensions: tuple = None) -> None:
+    def _subset(self, quantile: float) -> pd.DataFrame:
+        # Seeded random X% sample shared by both renderers (avoids bias from the frame's sort order)
+        return self.__df.sample(frac=quantile, random_state=0)
+
+    def plotly(self, quantile: float = None, dimensions: tuple = None, export_image: bool = False) -> None:
         # Use class-level values if parameters are not provided
         quantile = quantile if quantile is not None else self.__quantile
         dimensions = dimensions if dimensions is not None else self.__dimensions
 
-        # Create pair plot using Plotly (first X% of data)
-        fig = px.scatter_matrix(
-            self.__df[:int(len(self.__df) * quantile)],  # Match Seaborn subset behavior
-            dimensions=self.__df.columns  # Ensure all columns are plotted
-        )
+        # Same subset as the Seaborn renderer
+        df_subset = self._subset(quantile)
 
-        # Update marker styling
-        fig.update_traces(marker=dict(size=6, line=dict(width=1, color='black')))
+        # Create pair plot using the WebGL-backed Splom trace
+        fig = go.Figure(
+            data=go.Splom(
+                dimensions=[dict(label=c, values=df_subset[c]) for c in df_subset.columns],  # All columns
+                marker=dict(size=6, line=dict(width=1, color='black'))
+            )
+        )
 
         # Increase figure size
         fig.update_layout(
@@ -46,39 +55,46 @@ class RenderPairplot:
         html_export_path = os.path.join(self.__export_dir, f"{timestamp}_pairplot_plotly.html")
         fig.write_html(html_export_path)
 
-        # Save as an image (high resolution)
-        image_export_path = os.path.join(self.__export_dir, f"{timestamp}_pairplot_plotly.png")
-        fig.write_image(image_export_path, scale=3)
-
         # Display the plot in the Jupyter Notebook
         display(fig)
 
         print(f"Pairplot saved as interactive HTML: {html_export_path}")
-        print(f"Pairplot saved as image: {image_export_path}")
+
+        # Save as an image (high resolution) only when requested, kaleido export is the slowest step
+        if export_image:
+            image_export_path = os.path.join(self.__export_dir, f"{timestamp}_pairplot_plotly.png")
+            fig.write_image(image_export_path, scale=3)
+            print(f"Pairplot saved as image: {image_export_path}")
 
     def seaborn(self, quantile: float = None, dimensions: tuple = None) -> None:
         # Use class-level values if parameters are not provided
         quantile = quantile if quantile is not None else self.__quantile
         dimensions = dimensions if dimensions is not None else self.__dimensions
 
-        # Subset first X% of the DataFrame
-        df_subset = self.__df[:int(len(self.__df) * quantile)]
+        # Same subset as the Plotly renderer
+        df_subset = self._subset(quantile)
 
         # Set figure size to match Plotly
         plt.figure(figsize=(dimensions[0] / 100, dimensions[1] / 100))
 
-        # Create pairplot with styling to match Plotly
-        pairplot = sns.pairplot(
-            df_subset,
-            plot_kws={"s": 36, "edgecolor": "black", "linewidth": 1},  # Match marker size & border
-        )
+        if len(df_subset) > LARGE_SUBSET_ROWS:
+            # Large subsets: binned off-diagonals keep each panel's cost independent of row count
+            pairplot = sns.PairGrid(df_subset)
+            pairplot.map_diag(sns.histplot)
+            pairplot.map_offdiag(sns.histplot, bins=50)
+        else:
+            # Create pairplot with styling to match Plotly
+            pairplot = sns.pairplot(
+                df_subset,
+                plot_kws={"s": 36, "edgecolor": "black", "linewidth": 1},  # Match marker size & border
+            )
 
         # Ensure export folder exists
         os.makedirs(self.__export_dir, exist_ok=True)
         timestamp = datetime.now().strftime("%Y_%m_%d_%H%M%S")
 
-        # Save as high-resolution PNG (scale=3 equivalent to dpi=300)
+        # Save as PNG (dpi=150 is plenty at this figure size, dpi=300 quadruples the raster)
         image_export_path = os.path.join(self.__export_dir, f"{timestamp}_pairplot_seaborn.png")
-        pairplot.savefig(image_export_path, dpi=300)
+        pairplot.savefig(image_export_path, dpi=150)
 
         print(f"Pairplot saved as image: {image_export_path}")
\ No newline at end of file
@@ -24,6 +24,8 @@ Environment Assumptions:
 
 import os
 import re
+import string
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 prefect_version = "3.0.1"  # ie. '3.0.1' # str
@@ -33,6 +35,52 @@ local_root = "d:/Git/thinkstack_data_etl/src"  # str
 src_folder = f"{local_root}/src"  # str
 output_folder = "d:/exports/prefect_jobs"  # str
 
+# Directories that never contain flow modules; pruned from the walk so they are never traversed
+skip_dirs = {".git", "node_modules", "__pycache__"}
+
+# prefect.yaml body template (compiled once at import)
+_YAML_TPL = string.Template("""# Welcome to your prefect.yaml file! You can use this file for storing and managing
+# configuration for deploying your flows. We recommend committing this file to source
+# control along with your flow code.
+
+# Generic metadata about this project
+name: $project_name
+prefect-version: $prefect_version
+
+# build section allows you to manage and build docker images
+build: null
+
+# push section allows you to manage if and how this project is uploaded to remote locations
+push: null
+
+# pull section allows you to provide instructions for cloning this project in remote locations
+pull:
+- prefect.deployments.steps.set_working_directory:
+    directory: $src_root
+
+# the deployments section allows you to provide configuration for deploying flows
+deployments:
+- name: $deployment_name
+  version: null
+  tags: []
+  concurrency_limit: null
+  description: null
+  entrypoint: $entrypoint
+  parameters: { }
+  work_pool:
+    name: $worker_pool
+    work_queue_name: null
+    job_variables: { }
+enforce_parameter_schema: true
+schedules:
+- interval: $schedule_interval
+  anchor_date: '2024-01-01T01:00:00+00:00'
+  timezone: $schedule_timezone
+  active: $schedule_active
+  max_active_runs: null
+  catchup: false
+""".lstrip())
+
 
 def create_deployment_yaml(
         project_name: str = "undefined",
@@ -58,85 +106,85 @@ def create_deployment_yaml(
         schedule_active (str): Whether the schedule is active ('true' or 'false').
 
     Behavior:
-        - Creates a directory for exporting YAML if it doesn't exist.
+        - Expects the output folder to exist (created once before generation starts).
         - Builds a Prefect-compliant deployment file with the schedule and work pool settings.
-        - Writes the YAML to the output folder using the deployment name.
+        - Writes the YAML to the output folder using the deployment name, unless an identical file is already there.
 
     Output:
         A YAML file written to: {output_folder}/{deployment_name}-deploy.yaml
     """
 
-    # prefect.yaml body template
-    yaml_body = f"""# Welcome to your prefect.yaml file! You can use this file for storing and managing
-# configuration for deploying your flows. We recommend committing this file to source
-# control along with your flow code.
+    # Render the prefect.yaml body from the pre-compiled template
+    yaml_body = _YAML_TPL.substitute(
+        project_name=project_name,
+        prefect_version=prefect_version,
+        src_root=src_root,
+        deployment_name=deployment_name,
+        entrypoint=entrypoint,
+        worker_pool=worker_pool,
+        schedule_interval=schedule_interval,
+        schedule_timezone=schedule_timezone,
+        schedule_active=schedule_active
+    )
 
-# Generic metadata about this project
-name: {project_name}
-prefect-version: {prefect_version}
+    # Create the deployment directory if it doesn't exist
+    # Path(f"{output_folder}/{deployment_name}").mkdir(parents=True, exist_ok=True)
 
-# build section allows you to manage and build docker images
-build: null
+    # Skip the write when the file on disk already matches (avoids mtime churn and redeploys)
+    yaml_path = Path(output_folder) / f"{deployment_name}-deploy.yaml"
+    if yaml_path.exists() and yaml_path.read_text() == yaml_body:
+        print(f"Deployment {deployment_name} is unchanged, skipping")
+        return
 
-# push section allows you to manage if and how this project is uploaded to remote locations
-push: null
+    # Write the yaml file
+    yaml_path.write_text(yaml_body)
 
-# pull section allows you to provide instructions for cloning this project in remote locations
-pull:
-- prefect.deployments.steps.set_working_directory:
-    directory: {src_root}
 
-# the deployments section allows you to provide configuration for deploying flows
-deployments:
-- name: {deployment_name}
-  version: null
-  tags: []
-  concurrency_limit: null
-  description: null
-  entrypoint: {entrypoint}
-  parameters: {{ }}
-  work_pool:
-    name: {worker_pool}
-    work_queue_name: null
-    job_variables: {{ }}
-enforce_parameter_schema: true
-schedules:
-- interval: {schedule_interval}
-  anchor_date: '2024-01-01T01:00:00+00:00'
-  timezone: {schedule_timezone}
-  active: {schedule_active}
-  max_active_runs: null
-  catchup: false
-""".lstrip()
+# Collect one deployment per flow module found directly under a 'src' folder
+tasks = []
 
-    # Create the directory if it doesn't exist
-    Path(output_folder).mkdir(parents=True, exist_ok=True)
-    # Create the deployment directory if it doesn't exist
-    # Path(f"{output_folder}/{deployment_name}").mkdir(parents=True, exist_ok=True)
+for root, dirs, files in os.walk(local_root):
+    dirs[:] = sorted(d for d in dirs if d not in skip_dirs)  # Prune in place so os.walk skips them; sorted for a stable order
 
-    # Write the yaml file    
-    with open(f"{output_folder}/{deployment_name}-deploy.yaml", "w") as f:
-        f.write(yaml_body)
+    if 'src' not in dirs:
+        continue
 
+    for py in sorted(Path(root, 'src').glob('*.py')):
+        deployment = py.stem
+        tasks.append(dict(
+            project_name=py.parents[1].name,
+            project_dir=py.parent.as_posix().replace(local_root, src_root),
+            deployment_name=deployment,
+            entrypoint=f"{py.as_posix()}:{deployment}".replace(local_root, src_root),
+            worker_pool="default-worker-pool",
+            schedule_interval=3600.0,  # 1 hour
+            schedule_timezone="UTC",  # UTC timezone
+            schedule_active='true'  # Active schedule
+        ))
 
-for root, dirs, files in os.walk(local_root):
-    for d in dirs:
-        if d == 'src':
-            for file in os.listdir(f"{root}/{d}"):
-                if file.endswith(".py"):
-                    deployment = file.split(".")[0]
-                    print(f"Creating deployment for {deployment}")
-                    create_deployment_yaml(
-                        project_name=os.path.basename(root),
-                        project_dir=f"{root}/{d}".replace("\\", "/").replace(local_root, src_root),
-                        deployment_name=deployment,
-                        entrypoint= \
-                            f"{root}/{d}/{deployment}.py:{deployment}".replace("\\", "/").replace(local_root, src_root),
-                        worker_pool="default-worker-pool",
-                        schedule_interval=3600.0,  # 1 hour
-                        schedule_timezone="UTC",  # UTC timezone
-                        schedule_active='true'  # Active schedule
-                    )
-        else:
-            # print(f'{d} is not src!')
-            continue
+
+# YAML files are named by deployment, so two modules with the same stem would race on one file
+seen = {}
+unique_tasks = []
+
+for task in tasks:
+    first = seen.setdefault(task['deployment_name'], task)
+    if first is not task:
+        print(f"[WARN] Duplicate deployment {task['deployment_name']}: keeping {first['entrypoint']}, "
+              f"skipping {task['entrypoint']}")
+        continue
+    unique_tasks.append(task)
+
+tasks = unique_tasks
+
+
+def _create_deployment(task: dict) -> None:
+    print(f"Creating deployment for {task['deployment_name']}")
+    create_deployment_yaml(**task)
+
+
+# Create the output directory once, then write the YAML files in parallel (I/O bound)
+Path(output_folder).mkdir(parents=True, exist_ok=True)
+
+with ThreadPoolExecutor(max_workers=16) as executor:
+    list(executor.map(_create_deployment, tasks))
@@ -3,6 +3,12 @@ import datetime as dt
 import inspect
 import os
 
+# Prefer libyaml's C loader when PyYAML was built with it, fall back to pure Python
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 
 # Pull Config Info from YAML
 def prepare_tasks(config_dir: str = "./config.yaml") -> dict:
@@ -27,17 +33,19 @@ def prepare_tasks(config_dir: str = "./config.yaml") -> dict:
         - "_MONTH_DATA_TIMESTAMP": Zero-padded month (e.g. '07')
         - "_DAY_DATA_TIMESTAMP": Zero-padded day (e.g. '30')
 
+    Notes:
+        Parsing uses libyaml's `CSafeLoader` when available (PyYAML built against libyaml),
+        otherwise the pure-Python `SafeLoader`. Both are safe loaders with the same semantics.
+
     Raises:
         Will exit the program if the YAML file cannot be loaded properly.
         Returns a failure `result` block in case of unexpected errors.
     """
 
     try:
-        stamped_tasks = []
-
         try:
             with open(config_dir, "r") as stream:
-                yaml_config = yaml.safe_load(stream)
+                yaml_config = yaml.load(stream.read(), Loader=_Loader)
         except Exception as e:
             print(e)
             print(os.getcwd())
@@ -57,10 +65,10 @@ def prepare_tasks(config_dir: str = "./config.yaml") -> dict:
 
         }
 
+        # TASKS was just loaded for this call, so stamp it in place instead of copying each task
         for TASK in TASKS:
-            updated_task = TASK.copy()
-            updated_task["TIMESTAMPS"] = data_timestamps
-            stamped_tasks.append(updated_task)
+            TASK["TIMESTAMPS"] = data_timestamps
+        stamped_tasks = TASKS
 
         result = {
             "data": stamped_tasks,
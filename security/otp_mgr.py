@@ -10,6 +10,7 @@ Dependencies:
 - `pyotp` for TOTP generation
 - `pyzbar` for barcode/QR code decoding
 - `Pillow` (PIL) for image handling
+- `opencv-python` (optional) for faster grayscale QR decoding; falls back to `pyzbar` if missing
 
 Example Usage:
     python otp_qr_tool.py
@@ -20,10 +21,31 @@ the secret key or generate OTPs directly from images or encoded URIs.
 
 """
 
+from functools import lru_cache
+
 import pyotp
 from pyzbar.pyzbar import decode
 from PIL import Image
 
+try:
+    import cv2
+    _QRD = cv2.QRCodeDetector()  # Shared detector instance
+    _HAS_CV2 = True
+except ImportError:
+    _HAS_CV2 = False
+
+
+@lru_cache(maxsize=1024)
+def _totp_for(secret: str) -> pyotp.TOTP:
+    """Returns a cached TOTP object for the secret (only construction is cached, not the OTP value)."""
+    return pyotp.TOTP(secret)
+
+
+@lru_cache(maxsize=1024)
+def _totp_for_uri(uri: str):
+    """Returns a cached OTP object parsed from an otpauth:// URI."""
+    return pyotp.parse_uri(uri)
+
 
 class GenerateOTP:
     def __init__(self):
@@ -41,7 +63,7 @@ class GenerateOTP:
         Example:
             generate_otp_from_secret("JBSWY3DPEHPK3PXP")
         """
-        totp = pyotp.TOTP(secret_key)
+        totp = _totp_for(secret_key)
         print(totp.now())  # Generates the current OTP
 
     @staticmethod
@@ -56,13 +78,21 @@ class GenerateOTP:
             list[tuple[str, str]]: List of (barcode_type, decoded_data) pairs if any codes found.
             None: If no codes are found or the image cannot be processed.
         """
-        with open(image_path, 'rb') as image_file:
-            image = Image.open(image_file)
+        # Try OpenCV on a single-channel image first (QR codes only)
+        if _HAS_CV2:
+            img = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+            if img is not None:
+                data, _, _ = _QRD.detectAndDecode(img)
+                if data:
+                    return [('QRCODE', data)]
+
+        # Fall back to pyzbar, which also handles barcodes
+        with Image.open(image_path) as image:
             decoded_data = decode(image)
 
-            if decoded_data:
-                code_data = [(d.type, d.data.decode('utf-8')) for d in decoded_data]
-                return code_data
+        if decoded_data:
+            code_data = [(d.type, d.data.decode('utf-8')) for d in decoded_data]
+            return code_data
 
         return None
 
@@ -77,25 +107,21 @@ class GenerateOTP:
         Behavior:
             - Prints decoded QR code content.
             - Generates OTP if QR contains a valid otpauth:// URI.
-            - Uses `generate_otp_from_uri()` internally.
+            - Uses `scan_codes()` and `generate_otp_from_uri()` internally.
         """
-        with open(image_path, 'rb') as image_file:
-            image = Image.open(image_file)
-            decoded_data = decode(image)
-
-            if decoded_data:
-                code_data = [(d.type, d.data.decode('utf-8')) for d in decoded_data]
+        code_data = GenerateOTP.scan_codes(image_path)
 
-                print('Scanned Codes:')
-                for barcode_type, barcode_data in code_data:
-                    print('Barcode Type:', barcode_type)
-                    print('Barcode Data:', barcode_data)
+        if code_data:
+            print('Scanned Codes:')
+            for barcode_type, barcode_data in code_data:
+                print('Barcode Type:', barcode_type)
+                print('Barcode Data:', barcode_data)
 
-                otp = otp_generator.generate_otp_from_uri(code_data[0][1])
-                if otp:
-                    print('Generated OTP:', otp)
-            else:
-                print('No barcodes or QR codes found in the image.')
+            otp = GenerateOTP.generate_otp_from_uri(code_data[0][1])
+            if otp:
+                print('Generated OTP:', otp)
+        else:
+            print('No barcodes or QR codes found in the image.')
 
     @staticmethod
     def generate_otp_from_uri(uri):
@@ -113,7 +139,7 @@ class GenerateOTP:
             generate_otp_from_uri("otpauth://totp/Label?secret=ABCDEF123456&issuer=Example")
         """
         try:
-            otp_data = pyotp.parse_uri(uri)
+            otp_data = _totp_for_uri(uri)
             return otp_data.now()
         except Exception as e:
             print(f"Error parsing OTP URI: {e}")
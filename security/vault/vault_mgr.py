@@ -4,32 +4,153 @@ VaultManager: Secure credential retrieval using HashiCorp Vault.
 Supports:
 - Token authentication
 - Certificate-based authentication (preferred for automation)
+
+Use `VaultManager.instance()` to get the shared, process-wide instance.
 """
 
+import base64
+import functools
+import hashlib
 import hvac
-import threading
 import os
+import requests
+import threading
 import traceback
+from cachetools import TLRUCache
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from requests.adapters import HTTPAdapter
 from colorama import Fore, Style
 from loguru import logger
 
+# Vault token prefixes: service/batch/recovery (1.10+) and their legacy forms
+VAULT_TOKEN_PREFIXES = ("hvs.", "hvb.", "hvr.", "s.", "b.", "r.")
+
+
+def _new_session(verify=None, cert=None) -> requests.Session:
+    """
+    Builds a requests session with a shared connection pool for Vault calls.
+
+    hvac takes TLS settings from the session when one is passed (a truthy `session.verify`
+    overrides the client's `verify`), so the CA bundle and client cert are set here.
+    """
+    session = requests.Session()
+    if verify:
+        session.verify = verify
+    if cert:
+        session.cert = cert
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_token_client(vault_addr, token_digest, vault_ca_cert, vault_namespace) -> hvac.Client:
+    """
+    Builds a token client once per (addr, token digest, CA, namespace).
+    The cache key only holds a digest, so the token itself is re-read from the environment.
+    """
+    client = hvac.Client(
+        url=vault_addr,
+        token=os.environ.get("VAULT_TOKEN"),
+        verify=vault_ca_cert,
+        namespace=vault_namespace,
+        session=_new_session(verify=vault_ca_cert)
+    )
+
+    if vault_namespace:
+        client.adapter.namespace = vault_namespace
+
+    return client
+
+
+_verified_token_clients = set()  # clients that have passed `lookup-self` at least once
+
+
+def _token_client_authenticated(client: hvac.Client) -> bool:
+    """
+    Runs the `lookup-self` round-trip until it succeeds once per cached client; later checks are free.
+    Failures are not remembered, so a transient Vault error doesn't fail every later check.
+    """
+    if client in _verified_token_clients:
+        return True
+    if client.is_authenticated():
+        _verified_token_clients.add(client)
+        return True
+    return False
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_cert_client(vault_addr, vault_ca_cert, vault_client_cert, vault_client_key, vault_namespace) -> hvac.Client:
+    """Builds and authenticates a cert client once per (addr, CA, cert, key, namespace)."""
+    # Fail fast on missing cert/key files; one stat each, and only once per cached client
+    for p in (vault_client_cert, vault_client_key):
+        Path(p).stat()  # raises FileNotFoundError
+
+    client = hvac.Client(
+        url=vault_addr,
+        cert=(vault_client_cert, vault_client_key),
+        verify=vault_ca_cert,
+        namespace=vault_namespace,
+        session=_new_session(verify=vault_ca_cert, cert=(vault_client_cert, vault_client_key))
+    )
+
+    if vault_namespace:
+        client.adapter.namespace = vault_namespace
+
+    auth_response = client.auth.cert.login()
+
+    if "auth" not in auth_response or not auth_response["auth"]["client_token"]:
+        raise ValueError("Vault authentication using cert method failed.")
+
+    return client
+
 
 class VaultManager:
-    _instance = None
-    _lock = threading.Lock()
-
-    def __new__(cls, *args, **kwargs):
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super().__new__(cls)
-                cls._instance.__initialized = False
-        return cls._instance
-
-    def __init__(self, auth_method="cert"):
-        if not self.__initialized:
-            self.auth_method = auth_method.lower()
-            self.__client = self.get_client()
-            self.__initialized = True
+    _instances = {}  # (auth_method, debug, ttl, refresh_stale) -> VaultManager
+
+    @classmethod
+    def instance(cls, auth_method="cert", debug=False, ttl=300, refresh_stale=False) -> "VaultManager":
+        """
+        Returns the shared VaultManager for the given settings, creating it on first use.
+
+        Args:
+            auth_method (str): 'cert' (default) or 'token'
+            debug (bool): Enable extra diagnostics
+            ttl (float): Default cache seconds for secrets without their own TTL; 0 disables caching for them
+            refresh_stale (bool): Re-fetch recently used secrets in the background just before they expire
+
+        Returns:
+            VaultManager: Cached, authenticated instance
+        """
+        key = (auth_method.lower(), debug, ttl, refresh_stale)
+        try:
+            return cls._instances[key]  # Fast path: a single dict lookup
+        except KeyError:
+            # setdefault keeps the first instance if two threads race on a cold cache
+            return cls._instances.setdefault(key, cls(*key))
+
+    def __init__(self, auth_method="cert", debug=False, ttl=300, refresh_stale=False):
+        """
+        Args:
+            auth_method (str): 'cert' (default) or 'token'
+            debug (bool): Enable extra diagnostics
+            ttl (float): Default cache seconds for secrets without their own TTL; 0 disables caching for them
+            refresh_stale (bool): Re-fetch recently used secrets in the background just before they expire
+        """
+        self.auth_method = auth_method.lower()
+        self.debug = debug
+        self.ttl = ttl
+        self.refresh_stale = refresh_stale
+        self.__client = self.get_client()
+
+        # Bounded in-memory cache of secret reads, keyed by (mount_point, path). Entries are
+        # (secret, ttl) and each one expires after its own TTL (see __secret_ttl)
+        self.__secret_cache = TLRUCache(maxsize=256, ttu=lambda _key, entry, now: now + entry[1])
+        self.__secret_lock = threading.Lock()
+        self.__recently_read = set()  # keys read since their last background refresh
+        self.__refresh_scheduled = set()
 
     def get_client(self) -> hvac.Client:
         """
@@ -38,12 +159,16 @@ class VaultManager:
         if self.auth_method == "cert":
             return self.get_cert_client()
         else:
-            return self.get_token_client()
+            return self.get_token_client(verify_auth=self.debug)
 
     @staticmethod
-    def get_token_client() -> hvac.Client:
+    def get_token_client(verify_auth: bool = False) -> hvac.Client:
         """
-        Initializes and authenticates a Vault client using token-based authentication.
+        Initializes a Vault client using token-based authentication.
+
+        Args:
+            verify_auth (bool): Confirm the token with Vault (`lookup-self`) instead of only
+                checking its format locally. The result is cached per client.
         """
         try:
             vault_addr = os.environ.get("VAULT_ADDR")
@@ -54,24 +179,29 @@ class VaultManager:
             if not vault_addr or not vault_token:
                 raise ValueError("Missing required environment variables: VAULT_ADDR and/or VAULT_TOKEN.")
 
-            client = hvac.Client(
-                url=vault_addr,
-                token=vault_token,
-                verify=vault_ca_cert,
-                namespace=vault_namespace
+            # Reuse the authenticated client (and its connection pool) for this environment
+            client = _cached_token_client(
+                vault_addr,
+                hashlib.sha256(vault_token.encode()).hexdigest(),
+                vault_ca_cert,
+                vault_namespace
             )
 
-            if vault_namespace:
-                client.adapter.namespace = vault_namespace
-
-            if not client.is_authenticated():
-                raise ValueError("Vault authentication failed. Please check your VAULT_TOKEN.")
+            if verify_auth:
+                if not _token_client_authenticated(client):
+                    raise ValueError("Vault authentication failed. Please check your VAULT_TOKEN.")
+                status = "AUTHENTICATED"
+            else:
+                # Local format check only; the token is first used against Vault on read_secret
+                if not vault_token.startswith(VAULT_TOKEN_PREFIXES):
+                    logger.warning("VAULT_TOKEN does not look like a Vault token (unrecognized prefix).")
+                status = "CONFIGURED"
 
             print(
                 f"{Style.RESET_ALL} * Vault {Fore.LIGHTBLUE_EX}[TOKEN AUTH]{Style.RESET_ALL} "
-                f"Client is {Fore.GREEN}[AUTHENTICATED]{Style.RESET_ALL}"
+                f"Client is {Fore.GREEN}[{status}]{Style.RESET_ALL}"
             )
-            logger.info("Vault authenticated successfully using token method.")
+            logger.info(f"Vault token client {status.lower()}.")
             return client
 
         except Exception as e:
@@ -96,21 +226,15 @@ class VaultManager:
                     "Missing required environment variables: VAULT_ADDR, VAULT_CLIENT_CERT, or VAULT_CLIENT_KEY."
                 )
 
-            client = hvac.Client(
-                url=vault_addr,
-                cert=(vault_client_cert, vault_client_key),
-                verify=vault_ca_cert,
-                namespace=vault_namespace
+            # Reuse the authenticated client (and its connection pool) for this environment
+            client = _cached_cert_client(
+                vault_addr,
+                vault_ca_cert,
+                vault_client_cert,
+                vault_client_key,
+                vault_namespace
             )
 
-            if vault_namespace:
-                client.adapter.namespace = vault_namespace
-
-            auth_response = client.auth.cert.login()
-
-            if "auth" not in auth_response or not auth_response["auth"]["client_token"]:
-                raise ValueError("Vault authentication using cert method failed.")
-
             print(
                 f"{Style.RESET_ALL} * Vault {Fore.LIGHTBLUE_EX}[CERT AUTH]{Style.RESET_ALL} "
                 f"Client is {Fore.GREEN}[AUTHENTICATED]{Style.RESET_ALL}"
@@ -132,6 +256,146 @@ class VaultManager:
             path (str): The relative path under that mount
 
         Returns:
-            dict: Secret contents from Vault
+            dict: Secret contents from Vault (served from memory until the secret's TTL expires)
         """
-        return self.__client.secrets.kv.read_secret(mount_point=mount_point, path=f"/{path}")["data"]["data"]
\ No newline at end of file
+        key = (mount_point, path)
+        with self.__secret_lock:
+            entry = self.__secret_cache.get(key)
+            if entry is not None:
+                self.__recently_read.add(key)
+                return dict(entry[0])
+
+        # Miss or expired: this read is served fresh from Vault
+        secret, ttl = self.__fetch_secret(mount_point, path)
+        if ttl > 0:
+            with self.__secret_lock:
+                self.__secret_cache[key] = (secret, ttl)
+
+            if self.refresh_stale:
+                self.__schedule_refresh(key, ttl)
+
+        return dict(secret)
+
+    def read_secrets(self, mount_point: str, paths: list[str], max_workers: int = 8) -> dict[str, dict]:
+        """
+        Reads several secrets from the same KV mount concurrently over the shared connection pool.
+
+        Args:
+            mount_point (str): The top-level KV mount (e.g., 'api', 'db')
+            paths (list[str]): Relative paths under that mount
+            max_workers (int): Maximum number of concurrent Vault requests
+
+        Returns:
+            dict[str, dict]: Secret contents keyed by path
+        """
+        if not paths:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+            secrets = executor.map(lambda p: self.read_secret(mount_point, p), paths)
+            return dict(zip(paths, secrets))
+
+    def transit_encrypt_batch(self, mount_point: str, key_name: str, plaintexts: list[str]) -> list[str]:
+        """
+        Encrypts many values with a Vault transit key in a single request using `batch_input`.
+
+        Args:
+            mount_point (str): The transit engine mount (e.g., 'transit')
+            key_name (str): Name of the transit key
+            plaintexts (list[str]): Values to encrypt
+
+        Returns:
+            list[str]: Vault ciphertexts, in the same order as `plaintexts`
+        """
+        batch_input = [{"plaintext": base64.b64encode(p.encode()).decode()} for p in plaintexts]
+        resp = self.__client.secrets.transit.encrypt_data(
+            name=key_name,
+            batch_input=batch_input,
+            mount_point=mount_point
+        )
+        return [item["ciphertext"] for item in resp["data"]["batch_results"]]
+
+    def transit_decrypt_batch(self, mount_point: str, key_name: str, ciphertexts: list[str]) -> list[str]:
+        """
+        Decrypts many Vault transit ciphertexts in a single request using `batch_input`.
+
+        Args:
+            mount_point (str): The transit engine mount (e.g., 'transit')
+            key_name (str): Name of the transit key
+            ciphertexts (list[str]): Vault ciphertexts to decrypt
+
+        Returns:
+            list[str]: Decrypted values, in the same order as `ciphertexts`
+        """
+        batch_input = [{"ciphertext": c} for c in ciphertexts]
+        resp = self.__client.secrets.transit.decrypt_data(
+            name=key_name,
+            batch_input=batch_input,
+            mount_point=mount_point
+        )
+        return [base64.b64decode(item["plaintext"]).decode() for item in resp["data"]["batch_results"]]
+
+    def __fetch_secret(self, mount_point: str, path: str) -> tuple[dict, float]:
+        """Reads a secret straight from Vault, bypassing the cache, and returns (secret, ttl)."""
+        resp = self.__client.secrets.kv.read_secret(mount_point=mount_point, path=f"/{path}")
+        return resp["data"]["data"], self.__secret_ttl(resp)
+
+    def __secret_ttl(self, resp: dict) -> float:
+        """
+        Derives how long a secret may be cached from Vault's response.
+
+        Order of precedence:
+            1. A numeric `ttl` (seconds) in the KV v2 `custom_metadata`; 0 marks the secret ephemeral
+            2. A positive `lease_duration` (KV v2 always reports 0 here, which means "no lease")
+            3. The manager's default `ttl`
+        """
+        metadata = (resp.get("data") or {}).get("metadata") or {}
+        custom_metadata = metadata.get("custom_metadata") or {}
+
+        if "ttl" in custom_metadata:
+            try:
+                return float(custom_metadata["ttl"])
+            except (TypeError, ValueError):
+                logger.warning(f"Ignoring non-numeric custom_metadata ttl: {custom_metadata['ttl']!r}")
+
+        lease_duration = resp.get("lease_duration") or 0
+        if lease_duration > 0:
+            return float(lease_duration)
+
+        return float(self.ttl)
+
+    def __schedule_refresh(self, key: tuple, ttl: float) -> None:
+        """Schedules a background re-fetch of `key` shortly before its cache entry expires."""
+        with self.__secret_lock:
+            if key in self.__refresh_scheduled:
+                return
+            self.__refresh_scheduled.add(key)
+
+        timer = threading.Timer(ttl * 0.9, self.__refresh_secret, args=(key,))
+        timer.daemon = True
+        timer.start()
+
+    def __refresh_secret(self, key: tuple) -> None:
+        """Re-fetches `key` if it was read since the last refresh, otherwise lets it expire."""
+        with self.__secret_lock:
+            self.__refresh_scheduled.discard(key)
+            if key not in self.__recently_read:
+                return
+            self.__recently_read.discard(key)
+
+        try:
+            secret, ttl = self.__fetch_secret(*key)
+        except Exception:
+            logger.warning(f"Background refresh of Vault secret {key} failed: {traceback.format_exc()}")
+            return
+
+        if ttl > 0:
+            with self.__secret_lock:
+                self.__secret_cache[key] = (secret, ttl)
+
+            self.__schedule_refresh(key, ttl)
+
+
+def get_vault_manager(auth_method="cert", debug=False, ttl=300, refresh_stale=False) -> VaultManager:
+    """Alias for `VaultManager.instance()`, kept for existing callers."""
+    return VaultManager.instance(auth_method, debug, ttl, refresh_stale)
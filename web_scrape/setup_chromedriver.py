@@ -1,3 +1,29 @@
+import hashlib
+import json
+import os
+import stat
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import certifi
+import requests
+from colorama import Fore, Style
+
+# Owner/group/other executable bits applied to extracted files
+X_BITS = stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+
+
+def _iter_files(path: str):
+    """Recursively yields DirEntry objects for regular files under `path` (symlinks are skipped)."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
+
 class ChromeDriverSetup:
     """
     Automates the download and setup of a specific Chrome and Chromedriver version
@@ -27,6 +53,7 @@ class ChromeDriverSetup:
         self.arch = arch
         self.download_dir = download_dir
         self.base_uri = 'https://storage.googleapis.com/chrome-for-testing-public'
+        self._manifest_lock = threading.Lock()  # Guards .manifest.json during concurrent downloads
 
     def setup(self):
         """
@@ -36,22 +63,31 @@ class ChromeDriverSetup:
         version_dir = f"{self.download_dir}/{self.version}"
         os.makedirs(version_dir, exist_ok=True)
 
+        downloads = []
+
         if not self._chrome_exists(version_dir):
             print(f'{Fore.GREEN}Setting up Chrome version {self.version}!{Style.RESET_ALL}')
-            self.chrome_download_and_extract(version_dir)
-            if os.name != 'nt':
-                self.make_all_files_executable(version_dir)
+            downloads.append(self.chrome_download_and_extract)
         else:
             print(f'{Fore.CYAN}Chrome already exists at {version_dir}, skipping.{Style.RESET_ALL}')
 
         if not self._chromedriver_exists(version_dir):
             print(f'{Fore.GREEN}Setting up Chromedriver version {self.version}!{Style.RESET_ALL}')
-            self.chromedriver_download_and_extract(version_dir)
-            if os.name != 'nt':
-                self.make_all_files_executable(version_dir)
+            downloads.append(self.chromedriver_download_and_extract)
         else:
             print(f'{Fore.CYAN}Chromedriver already exists at {version_dir}, skipping.{Style.RESET_ALL}')
 
+        if downloads:
+            # Both archives are independent, so download them concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [executor.submit(download, version_dir) for download in downloads]
+                wait(futures)
+            for future in futures:
+                future.result()  # Re-raise any download failure
+
+            if os.name != 'nt':
+                self.make_all_files_executable(version_dir)
+
     @staticmethod
     def make_all_files_executable(path: str):
         """
@@ -63,36 +99,96 @@ class ChromeDriverSetup:
         """
         if os.name != 'nt':
             print(f'{Fore.MAGENTA}{Style.BRIGHT}Setting permissions on: {path}{Style.RESET_ALL}')
-            for root, _, files in os.walk(path):
-                for file in files:
-                    full_path = os.path.join(root, file)
-                    os.chmod(full_path, os.stat(full_path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+            for entry in _iter_files(path):
+                st = entry.stat(follow_symlinks=False)
+                if st.st_mode & X_BITS != X_BITS:
+                    os.chmod(entry.path, st.st_mode | X_BITS)
 
     def _chrome_exists(self, version_dir: str) -> bool:
         """
-        Checks if the Chrome binary folder exists for the given version.
+        Checks if Chrome is fully extracted for the given version and matches the remote archive.
 
         Args:
             version_dir (str): Base directory for the specific Chrome version.
 
         Returns:
-            bool: True if Chrome directory exists, False otherwise.
+            bool: True if the Chrome install is complete and current, False otherwise.
         """
-        expected_dir = os.path.join(version_dir, f"chrome-{self.arch}")
-        return os.path.exists(expected_dir)
+        return self._artifact_current('chrome', version_dir)
 
     def _chromedriver_exists(self, version_dir: str) -> bool:
         """
-        Checks if the Chromedriver folder exists for the given version.
+        Checks if Chromedriver is fully extracted for the given version and matches the remote archive.
+
+        Args:
+            version_dir (str): Base directory for the specific Chrome version.
+
+        Returns:
+            bool: True if the Chromedriver install is complete and current, False otherwise.
+        """
+        return self._artifact_current('chromedriver', version_dir)
+
+    def _zip_url(self, kind: str) -> str:
+        """Returns the Chrome-for-Testing archive URL for 'chrome' or 'chromedriver'."""
+        return f"{self.base_uri}/{self.version}/{self.arch}/{kind}-{self.arch}.zip"
+
+    def _read_manifest(self, version_dir: str) -> dict:
+        """Returns the parsed .manifest.json for the version dir, or an empty dict if missing/corrupt."""
+        try:
+            with open(os.path.join(version_dir, '.manifest.json'), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_manifest_entry(self, version_dir: str, kind: str, entry: dict):
+        """Records the download metadata for one archive in the version dir's .manifest.json."""
+        with self._manifest_lock:
+            manifest = self._read_manifest(version_dir)
+            manifest[kind] = entry
+            with open(os.path.join(version_dir, '.manifest.json'), 'w') as f:
+                json.dump(manifest, f, indent=2)
+
+    def _artifact_current(self, kind: str, version_dir: str) -> bool:
+        """
+        Validates a previous extract against its manifest entry and the remote archive headers.
+
+        The local check confirms every extracted file is present with its recorded size, which
+        catches partial extractions. A HEAD request then compares ETag/Content-Length so a ~200 B
+        response replaces the full download when nothing changed. If the HEAD fails (e.g. offline),
+        the local check alone decides.
 
         Args:
+            kind (str): Archive prefix, either 'chrome' or 'chromedriver'.
             version_dir (str): Base directory for the specific Chrome version.
 
         Returns:
-            bool: True if Chromedriver directory exists, False otherwise.
+            bool: True if the extracted files are complete and current, False otherwise.
         """
-        expected_dir = os.path.join(version_dir, f"chromedriver-{self.arch}")
-        return os.path.exists(expected_dir)
+        entry = self._read_manifest(version_dir).get(kind)
+        if not entry:
+            return False
+
+        for name, size in entry.get('files', {}).items():
+            try:
+                if os.path.getsize(os.path.join(version_dir, name)) != size:
+                    return False
+            except OSError:
+                return False
+
+        try:
+            head = requests.head(self._zip_url(kind), verify=certifi.where(), timeout=10)
+        except requests.RequestException:
+            return True
+        if head.status_code != 200:
+            return True
+
+        etag = head.headers.get('ETag')
+        content_length = head.headers.get('Content-Length')
+        if etag and entry.get('etag') and etag != entry['etag']:
+            return False
+        if content_length and entry.get('content_length') and content_length != entry['content_length']:
+            return False
+        return True
 
     def chrome_download_and_extract(self, base_path: str):
         """
@@ -101,23 +197,7 @@ class ChromeDriverSetup:
         Args:
             base_path (str): The directory where the archive will be extracted.
         """
-        zip_filename = f"chrome-{self.arch}.zip"
-        zip_url = f"{self.base_uri}/{self.version}/{self.arch}/{zip_filename}"
-        zip_path = os.path.join(base_path, zip_filename)
-
-        print(f"Downloading Chrome from {zip_url} to {zip_path}")
-        resp = requests.get(zip_url, verify=certifi.where())
-        if resp.status_code != 200:
-            raise RuntimeError(f"Failed to download Chrome zip (HTTP {resp.status_code})")
-        with open(zip_path, 'wb') as f:
-            f.write(resp.content)
-
-        print(f"Extracting Chrome to {base_path}")
-        with zipfile.ZipFile(zip_path, 'r') as z:
-            z.extractall(base_path)
-
-        os.remove(zip_path)
-        print(f"{Fore.YELLOW}Removed zip: {zip_path}{Style.RESET_ALL}")
+        self._download_and_extract('chrome', 'Chrome', base_path)
 
     def chromedriver_download_and_extract(self, base_path: str):
         """
@@ -126,20 +206,46 @@ class ChromeDriverSetup:
         Args:
             base_path (str): The directory where the archive will be extracted.
         """
-        zip_filename = f"chromedriver-{self.arch}.zip"
-        zip_url = f"{self.base_uri}/{self.version}/{self.arch}/{zip_filename}"
-        zip_path = os.path.join(base_path, zip_filename)
+        self._download_and_extract('chromedriver', 'ChromeDriver', base_path)
 
-        print(f"Downloading ChromeDriver from {zip_url} to {zip_path}")
-        resp = requests.get(zip_url, verify=certifi.where())
-        if resp.status_code != 200:
-            raise RuntimeError(f"Failed to download ChromeDriver zip (HTTP {resp.status_code})")
-        with open(zip_path, 'wb') as f:
-            f.write(resp.content)
+    def _download_and_extract(self, kind: str, label: str, base_path: str):
+        """
+        Streams a Chrome-for-Testing archive to disk in 1 MiB chunks, extracts it, records it in
+        the version dir's .manifest.json, and removes the zip.
 
-        print(f"Extracting ChromeDriver to {base_path}")
+        Args:
+            kind (str): Archive prefix, either 'chrome' or 'chromedriver'.
+            label (str): Display name used in log messages.
+            base_path (str): The directory where the archive will be extracted.
+        """
+        zip_url = self._zip_url(kind)
+        zip_path = os.path.join(base_path, f"{kind}-{self.arch}.zip")
+
+        print(f"Downloading {label} from {zip_url} to {zip_path}")
+        sha256 = hashlib.sha256()
+        with requests.get(zip_url, stream=True, verify=certifi.where()) as resp:
+            if resp.status_code != 200:
+                raise RuntimeError(f"Failed to download {label} zip (HTTP {resp.status_code})")
+            resp.raw.decode_content = True  # Undo any transfer compression while streaming
+            with open(zip_path, 'wb') as f:
+                for chunk in iter(lambda: resp.raw.read(1 << 20), b''):
+                    sha256.update(chunk)
+                    f.write(chunk)
+            etag = resp.headers.get('ETag')
+            content_length = resp.headers.get('Content-Length')
+
+        print(f"Extracting {label} to {base_path}")
         with zipfile.ZipFile(zip_path, 'r') as z:
             z.extractall(base_path)
+            files = {info.filename: info.file_size for info in z.infolist() if not info.is_dir()}
+
+        # Record what was installed so the next run can skip the download if nothing changed
+        self._write_manifest_entry(base_path, kind, {
+            'etag': etag,
+            'content_length': content_length,
+            'sha256': sha256.hexdigest(),
+            'files': files,
+        })
 
         os.remove(zip_path)
         print(f"{Fore.YELLOW}Removed zip: {zip_path}{Style.RESET_ALL}")